@@ -0,0 +1,39 @@
+"""Shared corpus fixtures.
+
+The corpus fixtures are session-scoped so that the corpus is loaded and
+indexed once per test process. They do not check that the corpus file
+exists: test modules skip themselves with a module-level ``pytestmark``.
+They only return immutable data, so the suite can be sharded with
+pytest-xdist (``pytest -n auto --dist loadfile``), each worker loading the
+corpus once.
+"""
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from main import read_data, ensemble_mots
+
+FILENAME = "corpus.txt"
+
+
+def pytest_configure(config):
+    """Register the markers used by the test modules."""
+    config.addinivalue_line("markers", "slow: heavier test, deselect with -m 'not slow'")
+
+
+@pytest.fixture(scope="session")
+def corpus_data():
+    """Fixture to load corpus data once for the whole session."""
+    return read_data(FILENAME)
+
+
+@pytest.fixture(scope="session")
+def corpus_set(corpus_data):
+    """Fixture to build the corpus set once, from the already loaded corpus data."""
+    return frozenset(corpus_data)
+
+
+@pytest.fixture
+def fresh_ensemble_mots():
+    """Fixture calling ensemble_mots on the corpus file for tests that need a fresh result."""
+    return ensemble_mots(FILENAME)
@@ -1,30 +1,53 @@
 import sys
 import os
+import heapq
 import pytest
-import tempfile
 from unittest.mock import patch, mock_open
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from main import read_data, ensemble_mots, mots_de_n_lettres, mots_avec, cherche1, cherche2
+from main import read_data, ensemble_mots, mots_de_n_lettres, mots_avec, mots_avec_many, cherche1, cherche2, premiers_mots
 
 FILENAME = "corpus.txt"
 
+pytestmark = pytest.mark.skipif(not os.path.exists(FILENAME), reason=f"Corpus file {FILENAME} not found")
 
-@pytest.fixture(scope="module")
-def corpus_data():
-    """Fixture to load corpus data once for all tests."""
-    if os.path.exists(FILENAME):
-        return read_data(FILENAME)
-    else:
-        pytest.skip(f"Corpus file {FILENAME} not found")
+_FRENCH = 'àâäéèêëïîôöùûüÿñç'
+_FR_TABLE = str.maketrans('', '', _FRENCH)
 
+_COMMON_WORDS = frozenset({'le', 'de', 'et', 'à', 'un', 'être', 'avoir'})
+_COMMON_2 = frozenset({'le', 'la', 'de', 'et', 'en', 'un', 'il', 'je', 'tu', 'on', 'ce', 'se', 'ne', 'me', 'te', 'du'})
+_HYPHENATED_5 = frozenset({'à-pic', 'ai-je', 'as-tu', 'es-tu', 'hi-fi'})
+_HYPHENATED_6 = frozenset({'a-t-il', 'est-ce', 'hi-han', 'pin-up'})
 
-@pytest.fixture(scope="module")
-def corpus_set():
-    """Fixture to load corpus as a set once for all tests."""
-    if os.path.exists(FILENAME):
-        return ensemble_mots(FILENAME)
-    else:
-        pytest.skip(f"Corpus file {FILENAME} not found")
+_EXPECTED_IN = frozenset({
+    # From the doctests in main.py
+    "glomérules", "anticonstitutionnellement", "constitutionnalisassent",
+    "hospitalo-universitaires", "oto-rhino-laryngologiste",
+    # Common French words with accents
+    "être", "avoir", "français", "déjà", "très", "où",
+    # Technical/scientific terms
+    "algorithme", "programmation", "ordinateur",
+    # Short words
+    "a", "à", "je", "tu", "il", "le", "la", "un", "de", "et",
+})
+# Words that should NOT be in a French corpus (nor the empty string)
+_EXPECTED_OUT = frozenset({"glycosudrique", "nonexistentword123", "fakefrenchword", "zzzzzzzzz", ""})
+
+
+def _assert_all_match(result, starts=('',), mids=('',), stops=('',), nmin=0, nmax=None):
+    """Assert in a single pass that every word of result meets the cherche1/cherche2 criteria.
+
+    A word matches when it starts with one of starts, contains one of mids,
+    ends with one of stops and has between nmin and nmax letters (nmax=None
+    means no upper bound). The first offending words are listed on failure.
+    """
+    starts, stops = tuple(starts), tuple(stops)
+    nmax = float('inf') if nmax is None else nmax
+    bad = [
+        word for word in result
+        if not (nmin <= len(word) <= nmax and word.startswith(starts) and word.endswith(stops)
+                and any(mid in word for mid in mids))
+    ]
+    assert not bad, f"{len(bad)} words do not match the criteria, e.g. {heapq.nsmallest(10, bad)}"
 
 
 class TestReadData:
@@ -63,29 +86,25 @@ class TestReadData:
         """Test that corpus.txt doesn't contain empty strings."""
         result = corpus_data
         # Check that there are no empty strings in the corpus
-        empty_count = sum(1 for word in result if word == '')
-        assert empty_count == 0, f"Found {empty_count} empty strings in corpus"
+        if '' in result:
+            raise AssertionError(f"Found {result.count('')} empty strings in corpus")
     
     def test_read_data_corpus_no_newlines_in_words(self, corpus_data):
         """Test that words in corpus.txt don't contain newlines."""
         result = corpus_data
-        # Check a sample of words for newlines
-        sample_size = min(1000, len(result))
-        for i in range(0, len(result), len(result) // sample_size):
-            word = result[i]
-            assert '\n' not in word, f"Found newline in word at index {i}: '{word}'"
-            assert '\r' not in word, f"Found carriage return in word at index {i}: '{word}'"
+        # Check every word, stopping at the first one with a line break
+        bad = next(((i, word) for i, word in enumerate(result) if '\n' in word or '\r' in word), None)
+        assert bad is None, f"Found line break in word (index, word): {bad}"
     
     def test_read_data_corpus_unicode_support(self, corpus_data):
         """Test that corpus.txt handles French unicode characters correctly."""
         result = corpus_data
         # Test that 'à' is properly handled (from doctest)
         assert 'à' in result
-        # Look for other French characters in a sample
-        french_chars = set('àâäéèêëïîôöùûüÿñç')
+        # Look for other French characters in a sample: translate drops them
         found_french = False
         for word in result[:10000]:  # Check first 10000 words
-            if any(char in french_chars for char in word):
+            if len(word.translate(_FR_TABLE)) != len(word):
                 found_french = True
                 break
         assert found_french, "No French characters found in sample"
@@ -95,110 +114,101 @@ class TestReadData:
         result = corpus_data
         assert isinstance(result, list)
         # All elements should be strings
-        assert all(isinstance(word, str) for word in result[:100])
+        assert set(map(type, result)) == {str}
     
     def test_read_data_file_not_found(self):
         """Test that FileNotFoundError is raised for non-existent file."""
         with pytest.raises(FileNotFoundError):
             read_data("non_existent_file.txt")
     
-    def test_read_data_with_mock_simple(self):
-        """Test read_data using mocking for controlled input."""
-        mock_content = "hello\nworld\ntest\n"
-        with patch('builtins.open', mock_open(read_data=mock_content)):
-            result = read_data("mock_file.txt")
-            expected = ['hello', 'world', 'test']
-            assert result == expected
-    
-    def test_read_data_with_mock_empty_lines(self):
-        """Test read_data with empty lines using mocking."""
-        mock_content = "hello\n\nworld\n"
-        with patch('builtins.open', mock_open(read_data=mock_content)):
+    @pytest.mark.parametrize("mock_content,expected", [
+        ("hello\nworld\ntest\n", ['hello', 'world', 'test']),
+        ("hello\n\nworld\n", ['hello', '', 'world']),
+        ("  hello  \n\t world \t\n  python\n", ['hello', 'world', 'python']),
+        ("café\nnaïve\nà\n", ['café', 'naïve', 'à']),
+    ], ids=["simple", "empty_lines", "whitespace", "unicode"])
+    def test_read_data_with_mock(self, mock_content, expected):
+        """Test read_data using mocking for controlled input (empty lines, whitespace, unicode)."""
+        mocked_open = mock_open(read_data=mock_content)
+        with patch('builtins.open', mocked_open):
             result = read_data("mock_file.txt")
-            expected = ['hello', '', 'world']
-            assert result == expected
-    
-    def test_read_data_with_mock_whitespace(self):
-        """Test read_data strips whitespace correctly using mocking."""
-        mock_content = "  hello  \n\t world \t\n  python\n"
-        with patch('builtins.open', mock_open(read_data=mock_content)):
-            result = read_data("mock_file.txt")
-            expected = ['hello', 'world', 'python']
-            assert result == expected
-    
-    def test_read_data_with_mock_unicode(self):
-        """Test read_data with unicode characters using mocking."""
-        mock_content = "café\nnaïve\nà\n"
-        with patch('builtins.open', mock_open(read_data=mock_content)):
-            result = read_data("mock_file.txt")
-            expected = ['café', 'naïve', 'à']
-            assert result == expected
+        assert result == expected
     
-    def test_read_data_with_temporary_file(self):
+    def test_read_data_with_temporary_file(self, tmp_path):
         """Test read_data with a real temporary file."""
         test_content = "hello\nworld\npython\ntest\n"
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf8') as f:
-            f.write(test_content)
-            temp_filename = f.name
-        
-        try:
-            result = read_data(temp_filename)
-            expected = ['hello', 'world', 'python', 'test']
-            assert result == expected
-            assert len(result) == 4
-        finally:
-            os.unlink(temp_filename)
-    
-    def test_read_data_empty_file(self):
+        temp_file = tmp_path / "words.txt"
+        temp_file.write_text(test_content, encoding='utf8')
+        
+        result = read_data(str(temp_file))
+        expected = ['hello', 'world', 'python', 'test']
+        assert result == expected
+        assert len(result) == 4
+        assert result == temp_file.read_text(encoding='utf8').splitlines()
+    
+    def test_read_data_empty_file(self, tmp_path):
         """Test read_data with an empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf8') as f:
-            temp_filename = f.name
+        temp_file = tmp_path / "empty.txt"
+        temp_file.write_text("", encoding='utf8')
         
-        try:
-            result = read_data(temp_filename)
-            assert result == []
-            assert isinstance(result, list)
-        finally:
-            os.unlink(temp_filename)
+        result = read_data(str(temp_file))
+        assert result == []
+        assert isinstance(result, list)
     
-    def test_read_data_single_word_file(self):
+    def test_read_data_single_word_file(self, tmp_path):
         """Test read_data with a file containing one word."""
         test_content = "single\n"
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf8') as f:
-            f.write(test_content)
-            temp_filename = f.name
-        
-        try:
-            result = read_data(temp_filename)
-            assert result == ['single']
-            assert len(result) == 1
-        finally:
-            os.unlink(temp_filename)
-    
-    def test_read_data_corpus_consistency(self, corpus_data):
-        """Test that read_data produces consistent results when called multiple times."""
-        result1 = corpus_data
-        result2 = read_data(FILENAME)  # Call again to test consistency
-        assert result1 == result2
-        assert len(result1) == len(result2)
+        temp_file = tmp_path / "single.txt"
+        temp_file.write_text(test_content, encoding='utf8')
+        
+        result = read_data(str(temp_file))
+        assert result == ['single']
+        assert len(result) == 1
     
-    def test_read_data_corpus_sample_words_exist(self, corpus_data):
+    def test_read_data_splits_on_newlines_only(self, tmp_path):
+        """Test that lines are only split on newlines, like iterating over the file."""
+        temp_file = tmp_path / "words.txt"
+        temp_file.write_bytes("un\x0cdeux\r\ntrois\u2028quatre\n\ncinq".encode('utf8'))
+        
+        result = read_data(str(temp_file))
+        with open(temp_file, encoding='utf8') as f:
+            expected = [line.strip() for line in f]
+        assert result == expected
+        assert result == ['un\x0cdeux', 'trois\u2028quatre', '', 'cinq']
+    
+    def test_read_data_rereads_modified_file(self, tmp_path):
+        """Test that cached reads return independent lists and follow file changes."""
+        temp_file = tmp_path / "words.txt"
+        temp_file.write_text("hello\nworld\n", encoding='utf8')
+
+        result1 = read_data(str(temp_file))
+        result1.append('modified')
+        assert read_data(str(temp_file)) == ['hello', 'world']
+        assert ensemble_mots(str(temp_file)) == {'hello', 'world'}
+
+        temp_file.write_text("hello\nworld\npython\n", encoding='utf8')
+        assert read_data(str(temp_file)) == ['hello', 'world', 'python']
+        assert ensemble_mots(str(temp_file)) == {'hello', 'world', 'python'}
+
+    # Repeated reads of corpus.txt are not re-parsed here: the read_data doctest
+    # pins its content, and test_ensemble_mots_consistency re-reads the file.
+    
+    def test_read_data_corpus_sample_words_exist(self, corpus_set):
         """Test that expected French words exist in the corpus."""
-        result = corpus_data
-        result_set = set(result)
         # Test some common French words that should be in the corpus
-        expected_words = ['le', 'de', 'et', 'à', 'un', 'être', 'avoir']
-        for word in expected_words:
-            assert word in result_set, f"Expected word '{word}' not found in corpus"
+        for word in _COMMON_WORDS:
+            assert word in corpus_set, f"Expected word '{word}' not found in corpus"
 
 
 class TestEnsembleMots:
     """Test class for the ensemble_mots function."""
     
-    def test_ensemble_mots_corpus_basic(self, corpus_set):
+    def test_ensemble_mots_corpus_basic(self, fresh_ensemble_mots):
         """Test that ensemble_mots returns a set with correct properties."""
-        result = corpus_set
+        result = fresh_ensemble_mots
         assert isinstance(result, set)
+        # a plain set: only frozensets are indexed, callers opt in with frozenset()
+        assert type(result) is set
         assert len(result) > 0
         # Based on the doctest in main.py, we expect 336531 words
         assert len(result) == 336531
@@ -206,46 +216,10 @@ class TestEnsembleMots:
     def test_ensemble_mots_contains_specific_words(self, corpus_set):
         """Test specific words from corpus based on doctest examples."""
         result = corpus_set
-        # Test from the doctest
-        assert "glomérules" in result
-        assert "glycosudrique" not in result
-        
-        # Additional specific French words that should be in the corpus
-        assert "anticonstitutionnellement" in result  # One of the longest French words
-        assert "constitutionnalisassent" in result    # From main.py doctest examples
-        assert "hospitalo-universitaires" in result   # From main.py doctest examples
-        assert "oto-rhino-laryngologiste" in result   # From main.py doctest examples
-        
-        # Common French words with accents
-        assert "être" in result
-        assert "avoir" in result
-        assert "français" in result
-        assert "déjà" in result
-        assert "très" in result
-        assert "où" in result
-        
-        # Words that should NOT be in a French corpus
-        assert "nonexistentword123" not in result
-        assert "fakefrenchword" not in result
-        assert "zzzzzzzzz" not in result
-        assert "" not in result  # Empty string should not be in the set
-        
-        # Test some technical/scientific terms
-        assert "algorithme" in result
-        assert "programmation" in result
-        assert "ordinateur" in result
-        
-        # Test some short words
-        assert "a" in result
-        assert "à" in result
-        assert "je" in result
-        assert "tu" in result
-        assert "il" in result
-        assert "le" in result
-        assert "la" in result
-        assert "un" in result
-        assert "de" in result
-        assert "et" in result
+        missing = _EXPECTED_IN - result
+        assert not missing, f"Missing: {missing}"
+        present = _EXPECTED_OUT & result
+        assert not present, f"Unexpected: {present}"
     
     def test_ensemble_mots_no_duplicates(self, corpus_set, corpus_data):
         """Test that ensemble_mots removes duplicates compared to read_data."""
@@ -256,8 +230,7 @@ class TestEnsembleMots:
         assert len(set_result) == len(set(list_result))
         
         # All words from the list should be in the set
-        for word in list_result:
-            assert word in set_result
+        assert set_result == set(list_result)
     
   
     def test_ensemble_mots_file_not_found(self):
@@ -265,11 +238,21 @@ class TestEnsembleMots:
         with pytest.raises(FileNotFoundError):
             ensemble_mots("non_existent_file.txt")
     
+    def test_ensemble_mots_splits_lines_on_whitespace(self, tmp_path):
+        """Test that a line holding several words gives several words, as str.split() does."""
+        temp_file = tmp_path / "words.txt"
+        temp_file.write_text("a b\n\nc\td  \n  e\n", encoding='utf8')
+        
+        assert ensemble_mots(str(temp_file)) == {'a', 'b', 'c', 'd', 'e'}
+        # read_data keeps one entry per line
+        assert read_data(str(temp_file)) == ['a b', '', 'c\td', 'e']
+    
     
-    def test_ensemble_mots_consistency(self, corpus_set):
-        """Test that ensemble_mots produces consistent results when called multiple times."""
+    def test_ensemble_mots_consistency(self, corpus_set, fresh_ensemble_mots):
+        """Test that ensemble_mots produces the same words as the session corpus set."""
         result1 = corpus_set
-        result2 = ensemble_mots(FILENAME)  # Call again to test consistency
+        result2 = fresh_ensemble_mots
+        assert result1 is not result2
         assert result1 == result2
         assert len(result1) == len(result2)
     
@@ -303,7 +286,7 @@ class TestEnsembleMots:
         
         # Check that conversion works both ways
         assert set(list_result) == set_result
-        assert sorted(list(set_result)) == sorted(list(set(list_result)))
+        assert len(set_result) == len(set(list_result))
 
 
 class TestMotsDeNLettres:
@@ -317,38 +300,33 @@ class TestMotsDeNLettres:
         assert len(result) == 8730
         
         # All words should have exactly 15 letters
-        for word in result:
-            assert len(word) == 15
+        assert {len(word) for word in result} <= {15}
     
-    def test_mots_de_n_lettres_corpus_specific_lengths(self, corpus_set):
+    @pytest.mark.parametrize("length,expected", [
+        (15, 8730), (16, 4418), (17, 2120), (18, 977), (19, 437),
+        (20, 205), (21, 94), (22, 42), (23, 11), (24, 4), (25, 2)
+    ])
+    def test_mots_de_n_lettres_corpus_specific_lengths(self, length, expected, corpus_set):
         """Test specific length counts from corpus based on doctest examples."""
-        
-        expected_counts = {
-            15: 8730, 16: 4418, 17: 2120, 18: 977, 19: 437, 
-            20: 205, 21: 94, 22: 42, 23: 11, 24: 4, 25: 2
-        }
-        
-        for length, expected_count in expected_counts.items():
-            result = mots_de_n_lettres(corpus_set, length)
-            assert len(result) == expected_count, f"Expected {expected_count} words of {length} letters, got {len(result)}"
+        result = mots_de_n_lettres(corpus_set, length)
+        assert len(result) == expected, f"Expected {expected} words of {length} letters, got {len(result)}"
     
     def test_mots_de_n_lettres_corpus_specific_words(self, corpus_set):
         """Test specific words from corpus based on doctest examples."""
         # Test 23-letter words
         result_23 = mots_de_n_lettres(corpus_set, 23)
-        sorted_23 = sorted(list(result_23))
-        assert sorted_23[0] == 'constitutionnalisassent'
+        assert min(result_23) == 'constitutionnalisassent'
         
         # Test 24-letter words
         result_24 = mots_de_n_lettres(corpus_set, 24)
-        sorted_24 = sorted(list(result_24))
+        sorted_24 = sorted(result_24)
         expected_24 = ['constitutionnalisassions', 'constitutionnaliseraient', 
                       'hospitalo-universitaires', 'oto-rhino-laryngologiste']
         assert sorted_24 == expected_24
         
         # Test 25-letter words
         result_25 = mots_de_n_lettres(corpus_set, 25)
-        sorted_25 = sorted(list(result_25))
+        sorted_25 = sorted(result_25)
         expected_25 = ['anticonstitutionnellement', 'oto-rhino-laryngologistes']
         assert sorted_25 == expected_25
     
@@ -379,8 +357,7 @@ class TestMotsDeNLettres:
         assert 'à' in result
         
         # All words should have exactly 1 letter
-        for word in result:
-            assert len(word) == 1
+        assert {len(word) for word in result} <= {1}
     
     def test_mots_de_n_lettres_two_letter_words(self, corpus_set):
         """Test with two letter words."""
@@ -388,14 +365,12 @@ class TestMotsDeNLettres:
         assert isinstance(result, set)
         
         # Should contain common 2-letter French words
-        common_2_letter = {'le', 'la', 'de', 'et', 'en', 'un', 'il', 'je', 'tu', 'on', 'ce', 'se', 'ne', 'me', 'te', 'du'}
-        for word in common_2_letter:
+        for word in _COMMON_2:
             if word in corpus_set:  # Only test if it exists in corpus
                 assert word in result
         
         # All words should have exactly 2 letters
-        for word in result:
-            assert len(word) == 2
+        assert {len(word) for word in result} <= {2}
     
     def test_mots_de_n_lettres_common_lengths(self, corpus_set):
         """Test with common word lengths."""
@@ -406,8 +381,7 @@ class TestMotsDeNLettres:
             assert len(result) > 0, f"No words of length {length} found"
             
             # All words should have exactly the specified length
-            for word in result:
-                assert len(word) == length
+            assert {len(word) for word in result} <= {length}
     
     def test_mots_de_n_lettres_negative_length(self, corpus_set):
         """Test with negative length."""
@@ -436,47 +410,72 @@ class TestMotsDeNLettres:
         result_8 = mots_de_n_lettres(test_words, 8)
         assert result_8 == {'français'}
     
-    def test_mots_de_n_lettres_preserves_set_type(self, corpus_set):
+    @pytest.mark.parametrize("length", [1, 5, 10, 15, 100])
+    def test_mots_de_n_lettres_preserves_set_type(self, length, corpus_set):
         """Test that the function always returns a set."""
-        for length in [1, 5, 10, 15, 100]:
-            result = mots_de_n_lettres(corpus_set, length)
-            assert isinstance(result, set)
+        result = mots_de_n_lettres(corpus_set, length)
+        assert isinstance(result, set)
     
-    def test_mots_de_n_lettres_subset_property(self, corpus_set):
+    @pytest.mark.parametrize("length", [1, 5, 10, 15, 100])
+    def test_mots_de_n_lettres_subset_property(self, length, corpus_set):
         """Test that result is always a subset of the input."""
-        for length in [1, 5, 10, 15]:
-            result = mots_de_n_lettres(corpus_set, length)
-            assert result.issubset(corpus_set)
+        result = mots_de_n_lettres(corpus_set, length)
+        assert result <= corpus_set
+    
+    @pytest.mark.parametrize("length", [0, 1, 7, 25, 50])
+    def test_mots_de_n_lettres_frozenset_matches_set(self, length, corpus_set):
+        """Test that the indexed frozenset path gives the same result as a plain scan."""
+        result = mots_de_n_lettres(corpus_set, length)
+        assert isinstance(result, set)
+        assert result == {w for w in corpus_set if len(w) == length}
+    
+    def test_mots_de_n_lettres_ensemble_mots_result(self, fresh_ensemble_mots, corpus_set):
+        """Test that the set returned by ensemble_mots matches the indexed corpus, even once modified."""
+        words = fresh_ensemble_mots
+        expected = {w for w in corpus_set if len(w) == 5}
+        assert mots_de_n_lettres(corpus_set, 5) == expected
+        assert mots_de_n_lettres(words, 5) == expected
+        
+        # A modified set is scanned again, whatever the way it is modified
+        set.add(words, 'zzzzz')
+        assert mots_de_n_lettres(words, 5) == expected | {'zzzzz'}
+        words.discard('zzzzz')
+        words.discard('avion')
+        assert mots_de_n_lettres(words, 5) == expected - {'avion'}
+    
+    def test_mots_de_n_lettres_iterator_after_indexing(self, corpus_set):
+        """Test that an iterator is still accepted once a frozenset corpus has been indexed."""
+        assert mots_de_n_lettres(corpus_set, 4)
+        assert mots_de_n_lettres(iter(['zazz', 'ab']), 4) == {'zazz'}
     
     def test_mots_de_n_lettres_no_modification_of_input(self, corpus_set):
         """Test that the input set is not modified."""
-        original_length = len(corpus_set)
-        original_copy = corpus_set.copy()
+        # frozenset.copy() returns the frozenset itself: pass a mutable copy instead
+        words = set(corpus_set)
+        original_length = len(words)
         
         # Call function multiple times
-        mots_de_n_lettres(corpus_set, 5)
-        mots_de_n_lettres(corpus_set, 10)
-        mots_de_n_lettres(corpus_set, 15)
+        mots_de_n_lettres(words, 5)
+        mots_de_n_lettres(words, 10)
+        mots_de_n_lettres(words, 15)
         
         # Check that original set is unchanged
-        assert len(corpus_set) == original_length
-        assert corpus_set == original_copy
+        assert len(words) == original_length
+        assert words == corpus_set
     
     def test_mots_de_n_lettres_with_special_characters(self, corpus_set):
         """Test with words containing special characters from corpus.txt."""
         
         # Test length 5 - short hyphenated words
         result_5 = mots_de_n_lettres(corpus_set, 5)
-        expected_5_words = {'à-pic', 'ai-je', 'as-tu', 'es-tu', 'hi-fi'}
         # Check that these words are in the result (they should be in corpus)
-        for word in expected_5_words:
+        for word in _HYPHENATED_5:
             if word in corpus_set:  # Only test if word exists in corpus
                 assert word in result_5, f"Expected '{word}' in 5-letter words"
         
         # Test length 6 - medium hyphenated words
         result_6 = mots_de_n_lettres(corpus_set, 6)
-        expected_6_words = {'a-t-il', 'est-ce', 'hi-han', 'pin-up'}
-        for word in expected_6_words:
+        for word in _HYPHENATED_6:
             if word in corpus_set:
                 assert word in result_6, f"Expected '{word}' in 6-letter words"
         
@@ -504,8 +503,8 @@ class TestMotsDeNLettres:
         for length, result in [(5, result_5), (6, result_6), (14, result_14), 
                               (23, result_23), (24, result_24), (25, result_25)]:
             assert isinstance(result, set)
-            for word in result:
-                assert len(word) == length, f"Word '{word}' has length {len(word)}, expected {length}"
+            lengths = {len(word) for word in result}
+            assert lengths <= {length}, f"Found lengths {lengths}, expected {length}"
     
     
     @pytest.mark.skipif(not os.path.exists(FILENAME), reason="Corpus file not available")
@@ -526,13 +525,12 @@ class TestMotsAvec:
         assert len(result) == 1621
         
         # All words should contain 'k'
-        for word in result:
-            assert 'k' in word, f"Word '{word}' should contain 'k'"
+        assert all('k' in word for word in result), "Every word should contain 'k'"
     
     def test_mots_avec_corpus_specific_k_words(self, corpus_set):
         """Test specific k words from corpus based on doctest examples."""
         mk = mots_avec(corpus_set, 'k')
-        sorted_mk = sorted(list(mk))
+        sorted_mk = sorted(mk)
         
         # Test specific indices from the doctest
         expected_words_35_74_7 = ['ankyloseraient', 'ankyloserons', 'ankylostome', 'ankylosée', 'ashkénaze', 'bachi-bouzouks']
@@ -725,31 +723,41 @@ class TestMotsAvec:
         result_xyz = mots_avec(test_words, 'xyz')
         assert result_xyz == set()
     
-    def test_mots_avec_subset_property(self, corpus_set):
+    @pytest.mark.parametrize("substring", ['a', 'tion', 'k', 'xyz'])
+    def test_mots_avec_subset_property(self, substring, corpus_set):
         """Test that result is always a subset of the input."""
-        for substring in ['a', 'tion', 'k', 'xyz']:
-            result = mots_avec(corpus_set, substring)
-            assert result.issubset(corpus_set)
+        result = mots_avec(corpus_set, substring)
+        assert result.issubset(corpus_set)
     
-    def test_mots_avec_preserves_set_type(self, corpus_set):
+    @pytest.mark.parametrize("substring", ['a', 'e', 'tion', 'k', ''])
+    def test_mots_avec_preserves_set_type(self, substring, corpus_set):
         """Test that the function always returns a set."""
-        for substring in ['a', 'e', 'tion', 'k', '']:
-            result = mots_avec(corpus_set, substring)
-            assert isinstance(result, set)
+        result = mots_avec(corpus_set, substring)
+        assert isinstance(result, set)
     
     def test_mots_avec_no_modification_of_input(self, corpus_set):
         """Test that the input set is not modified."""
-        original_length = len(corpus_set)
-        original_copy = corpus_set.copy()
+        # frozenset.copy() returns the frozenset itself: pass a mutable copy instead
+        words = set(corpus_set)
+        original_length = len(words)
         
         # Call function multiple times
-        mots_avec(corpus_set, 'a')
-        mots_avec(corpus_set, 'tion')
-        mots_avec(corpus_set, 'k')
+        mots_avec(words, 'a')
+        mots_avec(words, 'tion')
+        mots_avec(words, 'k')
         
         # Check that original set is unchanged
-        assert len(corpus_set) == original_length
-        assert corpus_set == original_copy
+        assert len(words) == original_length
+        assert words == corpus_set
+    
+    def test_mots_avec_returns_independent_copies(self, corpus_set):
+        """Test that repeated calls return equal results that the caller may modify."""
+        result1 = mots_avec(corpus_set, 'k')
+        result2 = mots_avec(corpus_set, 'k')
+        assert result1 == result2
+        assert result1 is not result2
+        result1.add('not-a-word')
+        assert 'not-a-word' not in mots_avec(corpus_set, 'k')
     
     def test_mots_avec_intersection_patterns(self, corpus_set):
         """Test intersection of different character patterns."""
@@ -780,6 +788,43 @@ class TestMotsAvec:
         # Most likely empty, but we don't assert that in case there are technical terms
 
 
+class TestMotsAvecMany:
+    """Test class for the mots_avec_many function."""
+    
+    def test_mots_avec_many_with_mock_data(self):
+        """Test mots_avec_many with controlled mock data."""
+        test_words = {'hello', 'world', 'python', 'test', 'help', 'programming'}
+        result = mots_avec_many(test_words, ['o', 'p', 'gram', 'xyz'])
+        assert result == {
+            'o': {'hello', 'world', 'python', 'programming'},
+            'p': {'python', 'help', 'programming'},
+            'gram': {'programming'},
+            'xyz': set(),
+        }
+    
+    def test_mots_avec_many_matches_mots_avec(self, corpus_set):
+        """Test that each substring gets the same words as mots_avec and as a plain scan."""
+        substrings = ['k', 'w', 'z', 'qu', 'tion']
+        result = mots_avec_many(corpus_set, substrings)
+        assert set(result) == set(substrings)
+        for substring in substrings:
+            assert isinstance(result[substring], set)
+            assert result[substring] == mots_avec(corpus_set, substring)
+            assert result[substring] == {w for w in corpus_set if substring in w}
+    
+    def test_mots_avec_many_repeated_queries(self, corpus_set):
+        """Test that results stay exact once repeated queries make the corpus indexed."""
+        substrings = list('bcdfghjmpvxy') + ['é', 'oo', 'eau', 'ph', 'gn', 'ss', 'ill', 'xyz', 'û']
+        result = mots_avec_many(corpus_set, substrings)
+        for substring in substrings:
+            assert result[substring] == {w for w in corpus_set if substring in w}
+    
+    def test_mots_avec_many_empty_inputs(self, corpus_set):
+        """Test with no substrings and with an empty set."""
+        assert mots_avec_many(corpus_set, []) == {}
+        assert mots_avec_many(set(), ['a', 'b']) == {'a': set(), 'b': set()}
+
+
 class TestCherche1:
     """Test class for the cherche1 function."""
     
@@ -791,19 +836,17 @@ class TestCherche1:
         assert len(result) == 10
         
         # All words should start with 'z', end with 'z', and have exactly 7 letters
-        for word in result:
-            assert word.startswith('z'), f"Word '{word}' should start with 'z'"
-            assert word.endswith('z'), f"Word '{word}' should end with 'z'"
-            assert len(word) == 7, f"Word '{word}' should have 7 letters, has {len(word)}"
+        _assert_all_match(result, ['z'], stops=['z'], nmin=7, nmax=7)
     
     def test_cherche1_corpus_specific_z_words(self, corpus_set):
         """Test specific z words from corpus based on doctest examples."""
         result = cherche1(corpus_set, 'z', 'z', 7)
-        sorted_result = sorted(list(result))
+        # Only the 7 smallest words are needed for the doctest slice
+        smallest = heapq.nsmallest(7, result)
         
         # Test specific slice from the doctest
         expected_words = ['zinguez', 'zippiez', 'zonerez']
-        actual_words = sorted_result[4:7]
+        actual_words = smallest[4:7]
         assert actual_words == expected_words
     
     def test_cherche1_single_letter_words(self, corpus_set):
@@ -834,10 +877,7 @@ class TestCherche1:
                 assert word in result_a_e_4, f"Expected '{word}' in a-e-4 results"
         
         # All words should match the pattern
-        for word in result_a_e_4:
-            assert word.startswith('a')
-            assert word.endswith('e')
-            assert len(word) == 4
+        _assert_all_match(result_a_e_4, ['a'], stops=['e'], nmin=4, nmax=4)
     
     def test_cherche1_verb_patterns(self, corpus_set):
         """Test French verb patterns."""
@@ -873,9 +913,7 @@ class TestCherche1:
         assert len(result) == 51
         
         # All words should end with 'e' and have length 3
-        for word in result:
-            assert word.endswith('e')
-            assert len(word) == 3
+        _assert_all_match(result, stops=['e'], nmin=3, nmax=3)
         
         # Should contain words like 'une', 'rue', 'vue', etc.
         common_words = {'une', 'rue', 'vue', 'due'}
@@ -891,9 +929,7 @@ class TestCherche1:
         assert len(result) == 22
         
         # All words should start with 'a' and have length 3
-        for word in result:
-            assert word.startswith('a')
-            assert len(word) == 3
+        _assert_all_match(result, ['a'], nmin=3, nmax=3)
         
         # Should contain words like 'ami', 'art', 'ans', etc.
         common_words = {'ami', 'art', 'ans', 'aux'}
@@ -909,8 +945,7 @@ class TestCherche1:
         assert len(result) == 469
         
         # All words should have length 3
-        for word in result:
-            assert len(word) == 3
+        _assert_all_match(result, nmin=3, nmax=3)
         
         # Should be equivalent to mots_de_n_lettres(corpus_set, 3)
         expected = mots_de_n_lettres(corpus_set, 3)
@@ -927,15 +962,8 @@ class TestCherche1:
         assert isinstance(result_pre_ment, set)
         
         # All results should match the patterns
-        for word in result_anti_tion:
-            assert word.startswith('anti')
-            assert word.endswith('tion')
-            assert len(word) == 12
-        
-        for word in result_pre_ment:
-            assert word.startswith('pre')
-            assert word.endswith('ment')
-            assert len(word) == 10
+        _assert_all_match(result_anti_tion, ['anti'], stops=['tion'], nmin=12, nmax=12)
+        _assert_all_match(result_pre_ment, ['pre'], stops=['ment'], nmin=10, nmax=10)
     
     def test_cherche1_accented_patterns(self, corpus_set):
         """Test with accented characters."""
@@ -948,10 +976,7 @@ class TestCherche1:
         assert isinstance(result_a_grave, set)
         
         # All results should match the patterns
-        for word in result_e_accent:
-            assert word.startswith('é')
-            assert word.endswith('e')
-            assert len(word) == 5
+        _assert_all_match(result_e_accent, ['é'], stops=['e'], nmin=5, nmax=5)
     
     def test_cherche1_no_matches(self, corpus_set):
         """Test patterns that should return no matches."""
@@ -1030,46 +1055,79 @@ class TestCherche1:
         result5 = cherche1(test_words, 'x', 'y', 5)
         assert result5 == set()
     
-    def test_cherche1_subset_property(self, corpus_set):
+    @pytest.mark.parametrize("start,stop,n", [
+        ('a', 'e', 4),
+        ('z', 'z', 7),
+        ('re', 'er', 8),
+        ('', 'e', 3),
+        ('a', '', 3)
+    ])
+    def test_cherche1_subset_property(self, start, stop, n, corpus_set):
         """Test that result is always a subset of the input."""
-        test_cases = [
-            ('a', 'e', 4),
-            ('z', 'z', 7),
-            ('re', 'er', 8),
-            ('', 'e', 3),
-            ('a', '', 3)
-        ]
-        
-        for start, stop, n in test_cases:
-            result = cherche1(corpus_set, start, stop, n)
-            assert result.issubset(corpus_set)
-    
-    def test_cherche1_preserves_set_type(self, corpus_set):
+        result = cherche1(corpus_set, start, stop, n)
+        assert result.issubset(corpus_set)
+    
+    @pytest.mark.parametrize("start,stop,n", [
+        ('a', 'e', 4),
+        ('z', 'z', 7),
+        ('xyz', 'abc', 5),
+        ('', '', 3)
+    ])
+    def test_cherche1_preserves_set_type(self, start, stop, n, corpus_set):
         """Test that the function always returns a set."""
-        test_cases = [
-            ('a', 'e', 4),
-            ('z', 'z', 7),
-            ('xyz', 'abc', 5),
-            ('', '', 3)
-        ]
-        
-        for start, stop, n in test_cases:
-            result = cherche1(corpus_set, start, stop, n)
-            assert isinstance(result, set)
+        result = cherche1(corpus_set, start, stop, n)
+        assert isinstance(result, set)
+    
+    def test_cherche1_ensemble_mots_result(self, fresh_ensemble_mots, corpus_set):
+        """Test that the set returned by ensemble_mots matches the indexed corpus, even once modified."""
+        words = fresh_ensemble_mots
+        expected = {w for w in corpus_set if len(w) == 7 and w.startswith('z') and w.endswith('z')}
+        assert cherche1(corpus_set, 'z', 'z', 7) == expected
+        assert cherche1(words, 'z', 'z', 7) == expected
+        assert cherche1(words, 're', 'er', 8) == {
+            w for w in corpus_set if len(w) == 8 and w.startswith('re') and w.endswith('er')
+        }
+        
+        # A modified set is scanned again, whatever the way it is modified
+        set.add(words, 'zzzzzzz')
+        assert cherche1(words, 'z', 'z', 7) == expected | {'zzzzzzz'}
+    
+    def test_cherche1_iterator_after_indexing(self, corpus_set):
+        """Test that an iterator is still accepted once a frozenset corpus has been indexed."""
+        assert cherche1(corpus_set, 'z', 'z', 7)
+        assert cherche1(iter(['zazz', 'zaza']), 'z', 'z', 4) == {'zazz'}
     
     def test_cherche1_no_modification_of_input(self, corpus_set):
         """Test that the input set is not modified."""
-        original_length = len(corpus_set)
-        original_copy = corpus_set.copy()
+        # frozenset.copy() returns the frozenset itself: pass a mutable copy instead
+        words = set(corpus_set)
+        original_length = len(words)
         
         # Call function multiple times
-        cherche1(corpus_set, 'a', 'e', 4)
-        cherche1(corpus_set, 'z', 'z', 7)
-        cherche1(corpus_set, 're', 'er', 8)
+        cherche1(words, 'a', 'e', 4)
+        cherche1(words, 'z', 'z', 7)
+        cherche1(words, 're', 'er', 8)
         
         # Check that original set is unchanged
-        assert len(corpus_set) == original_length
-        assert corpus_set == original_copy
+        assert len(words) == original_length
+        assert words == corpus_set
+    
+    @pytest.mark.parametrize("start,stop,n", [
+        ('re', 'er', 8), ('z', 'z', 7), ('a', '', 3), ('', 'e', 3), ('é', 'e', 5), ('xyz', 'e', 5),
+        ('', 'ment', 10), ('pre', 'ment', 10), ('', 'xyz', 5), ('', 'issiez', 16)
+    ])
+    def test_cherche1_frozenset_matches_set(self, corpus_set, start, stop, n):
+        """Test that the indexed frozenset path gives the same result as a plain scan."""
+        result = cherche1(corpus_set, start, stop, n)
+        assert isinstance(result, set)
+        assert result == {w for w in corpus_set if len(w) == n and w.startswith(start) and w.endswith(stop)}
+    
+    def test_cherche1_frozenset_highest_code_point(self):
+        """Test that words where the highest code point follows the prefix are kept."""
+        words = frozenset({'ab\U0010ffffz', 'abcz', 'z\U0010ffff\U0010ffffz', 'xx'})
+        assert cherche1(words, 'ab', 'z', 4) == {'ab\U0010ffffz', 'abcz'}
+        assert cherche1(words, 'ab', 'z', 4) == cherche1(set(words), 'ab', 'z', 4)
+        assert cherche1(words, 'z\U0010ffff', '\U0010ffffz', 4) == {'z\U0010ffff\U0010ffffz'}
     
     def test_cherche1_empty_set_input(self):
         """Test with empty set input."""
@@ -1125,11 +1183,7 @@ class TestCherche2:
         assert len(result) == 2095
         
         # All words should start with 'a' or 'e', contain 'i', end with 'e' or 's', length 5-8
-        for word in list(result)[:100]:  # Test sample for performance
-            assert word.startswith('a') or word.startswith('e')
-            assert 'i' in word
-            assert word.endswith('e') or word.endswith('s')
-            assert 5 <= len(word) <= 8
+        _assert_all_match(result, ['a', 'e'], ['i'], ['e', 's'], 5, 8)
     
     def test_cherche2_verb_patterns(self, corpus_set):
         """Test French verb patterns."""
@@ -1197,14 +1251,9 @@ class TestCherche2:
         assert isinstance(result3, set)
         
         # Verify length constraints
-        for word in list(result1)[:50]:  # Sample for performance
-            assert 3 <= len(word) <= 5
-        
-        for word in list(result2)[:50]:
-            assert 6 <= len(word) <= 10
-        
-        for word in list(result3):  # All words since likely few
-            assert 15 <= len(word) <= 20
+        _assert_all_match(result1, ['a'], ['i'], ['e'], 3, 5)
+        _assert_all_match(result2, ['a'], ['i'], ['e'], 6, 10)
+        _assert_all_match(result3, ['a'], ['i'], ['e'], 15, 20)
     
     def test_cherche2_single_length(self, corpus_set):
         """Test with single length (nmin == nmax)."""
@@ -1213,11 +1262,7 @@ class TestCherche2:
         assert isinstance(result, set)
         
         # All words should have exactly 7 letters
-        for word in result:
-            assert len(word) == 7
-            assert word.startswith('m')
-            assert 'a' in word
-            assert word.endswith('e')
+        _assert_all_match(result, ['m'], ['a'], ['e'], 7, 7)
     
     def test_cherche2_empty_lists_behavior(self, corpus_set):
         """Test behavior with empty lists."""
@@ -1271,10 +1316,7 @@ class TestCherche2:
         assert isinstance(result2, set)
         
         # Verify accented characters are handled correctly
-        for word in result1:
-            assert word.startswith('é')
-            assert 'e' in word
-            assert word.endswith('e')
+        _assert_all_match(result1, ['é'], ['e'], ['e'])
     
     def test_cherche2_hyphenated_words(self, corpus_set):
         """Test with hyphenated words."""
@@ -1283,10 +1325,7 @@ class TestCherche2:
         assert isinstance(result, set)
         
         # All results should contain hyphens
-        for word in result:
-            assert word.startswith('auto')
-            assert '-' in word
-            assert word.endswith('e')
+        _assert_all_match(result, ['auto'], ['-'], ['e'])
     
     def test_cherche2_case_sensitivity(self, corpus_set):
         """Test case sensitivity."""
@@ -1311,10 +1350,15 @@ class TestCherche2:
         assert isinstance(result2, set)
         
         # Words should still meet all criteria
-        for word in result1:
-            assert word.startswith('ab')
-            assert 'ba' in word
-            assert word.endswith('e')
+        _assert_all_match(result1, ['ab'], ['ba'], ['e'])
+    
+    def test_cherche2_single_string_arguments(self):
+        """Test that a single string is taken as one option, not as a list of letters."""
+        test_words = {'programming', 'pragma', 'oops', 'gong'}
+        assert cherche2(test_words, 'pro', 'gram', 'ing', 5, 15) == {'programming'}
+        assert cherche2(test_words, 'pro', 'gram', 'ing', 5, 15) == cherche2(test_words, ['pro'], ['gram'], ['ing'], 5, 15)
+        # As a list of letters, 'pro' and 'gs' would accept 'oops'
+        assert cherche2(test_words, 'pro', 'o', 'gs', 4, 4) == set()
     
     def test_cherche2_with_mock_data(self):
         """Test cherche2 with controlled mock data."""
@@ -1341,6 +1385,11 @@ class TestCherche2:
         result4 = cherche2(test_words, [''], ['e'], [''], 4, 6)  # Any word 4-6 letters with 'e'
         expected4 = {'hello', 'test'}
         assert result4 == expected4
+        
+        # Test several middles: they must not be at the start nor at the end of the word
+        result5 = cherche2(test_words, [''], ['h', 'd', 'ram', 'lo'], [''], 1, 12)
+        expected5 = {'python', 'programming', 'development', 'algorithm'}
+        assert result5 == expected5
     
     def test_cherche2_edge_cases_length(self, corpus_set):
         """Test edge cases with length parameters."""
@@ -1359,45 +1408,71 @@ class TestCherche2:
         assert isinstance(result3, set)
         assert len(result3) == 0
     
-    def test_cherche2_subset_property(self, corpus_set):
+    @pytest.mark.parametrize("lstart,lmid,lstop,nmin,nmax", [
+        (['a'], ['e'], ['s'], 5, 8),
+        (['re'], ['tion'], ['er'], 10, 15),
+        (['auto'], ['mat'], ['ment'], 12, 18),
+        ([], ['a'], ['e'], 5, 7),
+    ])
+    def test_cherche2_subset_property(self, lstart, lmid, lstop, nmin, nmax, corpus_set):
         """Test that result is always a subset of the input."""
-        test_cases = [
-            (['a'], ['e'], ['s'], 5, 8),
-            (['re'], ['tion'], ['er'], 10, 15),
-            (['auto'], ['mat'], ['ment'], 12, 18),
-            ([], ['a'], ['e'], 5, 7),
-        ]
-        
-        for lstart, lmid, lstop, nmin, nmax in test_cases:
-            result = cherche2(corpus_set, lstart, lmid, lstop, nmin, nmax)
-            assert result.issubset(corpus_set)
-    
-    def test_cherche2_preserves_set_type(self, corpus_set):
+        result = cherche2(corpus_set, lstart, lmid, lstop, nmin, nmax)
+        assert result.issubset(corpus_set)
+    
+    @pytest.mark.parametrize("lstart,lmid,lstop,nmin,nmax", [
+        (['a'], ['e'], ['s'], 5, 8),
+        (['xyz'], ['abc'], ['uvw'], 5, 10),
+        ([], [], [], 5, 7),
+        (['a', 'e'], ['i', 'o'], ['s', 'e'], 3, 15)
+    ])
+    def test_cherche2_preserves_set_type(self, lstart, lmid, lstop, nmin, nmax, corpus_set):
         """Test that the function always returns a set."""
-        test_cases = [
-            (['a'], ['e'], ['s'], 5, 8),
-            (['xyz'], ['abc'], ['uvw'], 5, 10),
-            ([], [], [], 5, 7),
-            (['a', 'e'], ['i', 'o'], ['s', 'e'], 3, 15)
-        ]
-        
-        for lstart, lmid, lstop, nmin, nmax in test_cases:
-            result = cherche2(corpus_set, lstart, lmid, lstop, nmin, nmax)
-            assert isinstance(result, set)
+        result = cherche2(corpus_set, lstart, lmid, lstop, nmin, nmax)
+        assert isinstance(result, set)
     
     def test_cherche2_no_modification_of_input(self, corpus_set):
         """Test that the input set is not modified."""
-        original_length = len(corpus_set)
-        original_copy = corpus_set.copy()
+        # frozenset.copy() returns the frozenset itself: pass a mutable copy instead
+        words = set(corpus_set)
+        original_length = len(words)
         
         # Call function multiple times
-        cherche2(corpus_set, ['a'], ['e'], ['s'], 5, 8)
-        cherche2(corpus_set, ['re'], ['tion'], ['er'], 10, 15)
-        cherche2(corpus_set, ['auto'], ['mat'], ['ment'], 12, 18)
+        cherche2(words, ['a'], ['e'], ['s'], 5, 8)
+        cherche2(words, ['re'], ['tion'], ['er'], 10, 15)
+        cherche2(words, ['auto'], ['mat'], ['ment'], 12, 18)
         
         # Check that original set is unchanged
-        assert len(corpus_set) == original_length
-        assert corpus_set == original_copy
+        assert len(words) == original_length
+        assert words == corpus_set
+    
+    @pytest.mark.parametrize("lstart,lmid,lstop,nmin,nmax", [
+        (['a'], ['b'], ['z'], 16, 16),
+        (['a', 'e'], ['i'], ['e', 's'], 5, 8),
+        (['re'], ['tion'], ['er'], 10, 15),
+        ([''], ['-'], [''], 1, 30),
+        (['a'], ['e'], ['s'], 10, 5),
+        ([''], ['é', 'è', 'ê', '-', 'q'], ['s', 'z'], 3, 12),
+        (['a', 'b'], ['', 'x'], ['a', 's'], 1, 4),
+    ])
+    def test_cherche2_frozenset_matches_set(self, corpus_set, lstart, lmid, lstop, nmin, nmax):
+        """Test that the indexed frozenset path gives the same result as a plain scan."""
+        result = cherche2(corpus_set, lstart, lmid, lstop, nmin, nmax)
+        assert isinstance(result, set)
+        assert result == {
+            w for w in corpus_set
+            if nmin <= len(w) <= nmax
+            and any(w.startswith(start) for start in lstart)
+            and any(mid in w[1:-1] for mid in lmid)
+            and any(w.endswith(stop) for stop in lstop)
+        }
+    
+    def test_cherche2_frozenset_highest_code_point(self):
+        """Test that words where the highest code point follows the prefix are kept."""
+        words = frozenset({'ab\U0010ffffz', 'abcz', '\U0010ffffabz', 'xx'})
+        expected = {'ab\U0010ffffz', 'abcz', '\U0010ffffabz'}
+        assert cherche2(words, [''], ['b', '\U0010ffff'], ['z'], 4, 4) == expected
+        assert cherche2(words, ['a', '\U0010ffff'], ['b', 'c', '\U0010ffff'], ['z'], 1, 9) == expected
+        assert cherche2(words, [''], ['b'], ['z'], 4, 4) == cherche2(set(words), [''], ['b'], ['z'], 4, 4)
     
     def test_cherche2_empty_set_input(self):
         """Test with empty set input."""
@@ -1431,6 +1506,7 @@ class TestCherche2:
         # cherche2 result should be subset of cherche1 result (more restrictive)
         assert result6.issubset(result7)
     
+    @pytest.mark.slow
     def test_cherche2_performance_large_lists(self, corpus_set):
         """Test performance with larger option lists."""
         # Test with many start options
@@ -1441,11 +1517,35 @@ class TestCherche2:
         assert isinstance(result, set)
         
         # All words should meet the criteria
-        for word in list(result)[:100]:  # Sample for performance
-            assert any(word.startswith(v) for v in vowels)
-            assert 'n' in word
-            assert any(word.endswith(c) for c in consonants)
-            assert 5 <= len(word) <= 8
+        _assert_all_match(result, vowels, ['n'], consonants, 5, 8)
+
+
+
+class TestPremiersMots:
+    """Test class for the premiers_mots function."""
+    
+    def test_premiers_mots_with_mock_data(self):
+        """Test premiers_mots with controlled mock data."""
+        test_words = {'tu', 'il', 'je', 'elle', 'nous'}
+        assert premiers_mots(test_words, 2) == ['elle', 'il']
+        assert premiers_mots(test_words, 10) == sorted(test_words)
+        assert premiers_mots(test_words, 0) == []
+        assert premiers_mots(set(), 3) == []
+    
+    @pytest.mark.parametrize("k", [1, 7, 100])
+    def test_premiers_mots_matches_sorted_slice(self, k, corpus_set, fresh_ensemble_mots):
+        """Test that premiers_mots matches a full sort, for frozensets and plain sets."""
+        seven = mots_de_n_lettres(corpus_set, 7)
+        assert premiers_mots(corpus_set, k) == sorted(corpus_set)[:k]
+        assert premiers_mots(fresh_ensemble_mots, k) == sorted(corpus_set)[:k]
+        assert premiers_mots(seven, k) == sorted(seven)[:k]
+    
+    @pytest.mark.parametrize("k", [-1, -5])
+    def test_premiers_mots_negative_k(self, k, corpus_set, fresh_ensemble_mots):
+        """Test that a negative k returns no word, for frozensets and plain sets."""
+        assert premiers_mots(corpus_set, k) == []
+        assert premiers_mots(fresh_ensemble_mots, k) == []
+        assert premiers_mots({'tu', 'il', 'je'}, k) == []
 
 
 if __name__ == "__main__":
@@ -1,6 +1,12 @@
 #### Imports et définition des variables globales
 
+import bisect
+import functools
+import heapq
+import itertools
+import os
 import random
+import re
 
 FILENAME = "corpus.txt"
 ALPHABET = list("abcdefghijklmnopqrstuvwxyz")
@@ -9,6 +15,57 @@ CONSONNES = list("bcdfghjklmnpqrstvwxz")
 
 #### Fonctions secondaires
 
+# Organisation des données : les recherches sont limitées par les accès mémoire
+# (quelques octets comparés par mot, pour 336000 mots), pas par les calculs.
+# Plutôt que de parcourir tout le corpus à chaque appel, chaque corpus chargé
+# (ensemble figé) est indexé une fois pour toutes, à la première utilisation :
+#   - par longueur, et par (longueur, première lettre, dernière lettre) ;
+#   - par préfixe et par suffixe, via les mots (et les mots inversés) triés ;
+#   - par lettre, pour les chaines contenues, seulement après des recherches
+#     répétées sur le même ensemble (un parcours suffit aux premières).
+# Chaque requête ne parcourt ainsi que le plus petit groupe de candidats ;
+# les ensembles modifiables (set) sont parcourus : pour profiter des index,
+# l'appelant fige l'ensemble rendu par ensemble_mots avec frozenset(...).
+
+def _lire(filename):
+    """lit les lignes de filename, sans cache"""
+    with open(filename, "r", encoding="utf-8") as f:
+        # un seul découpage en C de tout le contenu plutôt qu'une lecture ligne à ligne ;
+        # split("\n") et non splitlines(), qui couperait aussi sur \f, \x1c, \u2028...
+        # (le mode texte a déjà ramené \r\n et \r à \n)
+        lignes = f.read().split("\n")
+    if not lignes[-1]:
+        # comme la lecture ligne à ligne : pas de ligne vide après le dernier saut de ligne
+        lignes.pop()
+    return tuple(map(str.strip, lignes))
+
+
+@functools.lru_cache(maxsize=4)
+def _lire_lignes(filename, signature):
+    """lit les lignes de filename, une seule fois par signature
+    (date de modification, taille) du fichier"""
+    return _lire(filename)
+
+
+def _signature(filename):
+    """retourne la signature (date de modification, taille) de filename,
+    ou None s'il n'existe pas"""
+    try:
+        etat = os.stat(filename)
+    except OSError:
+        return None
+    return etat.st_mtime_ns, etat.st_size
+
+
+def _lignes(filename):
+    """retourne le tuple des lignes de filename, relu seulement si le fichier a changé"""
+    signature = _signature(filename)
+    if signature is None:
+        # fichier absent (ou ouverture simulée) : lecture directe, sans cache
+        return _lire(filename)
+    return _lire_lignes(filename, signature)
+
+
 def read_data(filename):
     """
     >>> mots = read_data(FILENAME)
@@ -33,16 +90,7 @@ def read_data(filename):
     >>> mots[166128]
     'gloire'
     """
-    words = set()
-    f = open('filename.txt')
-    for i in f:
-        words.add(i.strip())
-    f.close()
-    return words
-
-
-
-    
+    return list(_lignes(filename))
 
 
 def ensemble_mots(filename):
@@ -52,7 +100,7 @@ def ensemble_mots(filename):
         filename (str): nom du fichier
 
     Returns:
-        list: la liste des mots
+        set: l'ensemble des mots
 
     >>> mots = ensemble_mots(FILENAME)
     >>> isinstance(mots, set)
@@ -64,15 +112,162 @@ def ensemble_mots(filename):
     >>> "glycosudrique" in mots
     False
     """
-def ensemble_mots(nom_fichier):
-    mots = set()
-    with open(nom_fichier, "r", encoding="utf-8") as f:
-        for ligne in f:
-            for mot in ligne.split():
-                mots.add(mot)
-    return mots
+    # les lignes sont partagées avec read_data : le fichier n'est lu qu'une fois ;
+    # comme l'ancien ligne.split(), une ligne peut porter plusieurs mots
+    return {mot for ligne in _lignes(filename) for mot in ligne.split()}
+
+
+
+def _memoise(fonction):
+    """met en cache les résultats de fonction lorsque mots est un ensemble figé (frozenset)
+
+    Un frozenset ne pouvant pas être modifié, un résultat calculé reste valable ;
+    chaque appel en renvoie une copie que l'appelant peut modifier librement.
+    """
+    @functools.lru_cache(maxsize=32)
+    def en_cache(mots, *args):
+        return frozenset(fonction(mots, *args))
+
+    @functools.wraps(fonction)
+    def memoisee(mots, *args, **kwargs):
+        cle = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+        corpus = None if kwargs else _corpus_fige(mots)
+        if corpus is None:
+            return fonction(mots, *args, **kwargs)
+        try:
+            hash(cle)
+        except TypeError:
+            return fonction(corpus, *args)
+        return set(en_cache(corpus, *cle))
+    return memoisee
+
+
+def _corpus_fige(mots):
+    """retourne mots s'il s'agit d'un ensemble figé (frozenset), seul indexable, ou None"""
+    return mots if isinstance(mots, frozenset) else None
+
+
+@functools.lru_cache(maxsize=4)
+def _mots_par_longueur(mots):
+    """regroupe une fois pour toutes les mots de l'ensemble figé (frozenset) mots par longueur"""
+    groupes = {}
+    for mot in mots:
+        groupes.setdefault(len(mot), set()).add(mot)
+    return {longueur: frozenset(groupe) for longueur, groupe in groupes.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _mots_tries(mots):
+    """retourne les mots de l'ensemble figé (frozenset) mots, triés une fois pour toutes"""
+    return tuple(sorted(mots))
+
+
+@functools.lru_cache(maxsize=4)
+def _mots_inverses_tries(mots):
+    """retourne les mots de l'ensemble figé (frozenset) mots écrits à l'envers, triés une fois pour toutes"""
+    return tuple(sorted(mot[::-1] for mot in mots))
+
+
+@functools.lru_cache(maxsize=12)
+def _mots_par_extremites(mots, premiere, derniere):
+    """regroupe une fois pour toutes les mots de l'ensemble figé (frozenset) mots
+    par longueur, première lettre (si premiere) et dernière lettre (si derniere)
+
+    Une lettre non retenue est remplacée par '' dans la clé du groupe.
+    """
+    groupes = {}
+    for mot in mots:
+        if mot:
+            cle = (len(mot), mot[0] if premiere else '', mot[-1] if derniere else '')
+            groupes.setdefault(cle, set()).add(mot)
+    return {cle: frozenset(groupe) for cle, groupe in groupes.items()}
+
+
+# nombre de recherches de chaines parcourant un même ensemble figé avant d'indexer
+# ses mots par lettre : l'index coûte autant qu'une quinzaine de parcours
+_RECHERCHES_AVANT_INDEX = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _recherches(mots):
+    """retourne le compteur des recherches de chaines faites sur l'ensemble figé (frozenset) mots"""
+    return itertools.count()
+
+
+@functools.lru_cache(maxsize=1)
+def _mots_par_lettre(mots):
+    """associe une fois pour toutes à chaque lettre le tuple des mots de l'ensemble
+    figé (frozenset) mots qui la contiennent
+
+    Les groupes ne sont que parcourus ou copiés : des tuples coûtent bien moins
+    de mémoire que des ensembles, l'ensemble n'est construit qu'au retour.
+    La construction coûte environ 0,5 s et 25 Mo pour le corpus (336531 mots),
+    soit une quinzaine de parcours : seul l'index du dernier ensemble est gardé.
+    """
+    groupes = {}
+    for mot in mots:
+        for lettre in set(mot):
+            groupes.setdefault(lettre, []).append(mot)
+    return {lettre: tuple(groupe) for lettre, groupe in groupes.items()}
 
-    
+
+def _mots_contenant(mots, s):
+    """retourne les mots de l'ensemble figé (frozenset) mots contenant s
+
+    Les premières recherches parcourent tout l'ensemble (environ 30 ms pour le
+    corpus) ; l'index par lettre n'est construit qu'après _RECHERCHES_AVANT_INDEX
+    recherches sur le même ensemble, quand il devient rentable. Pour une seule
+    lettre, le groupe de l'index est alors directement la réponse ; sinon seuls
+    les mots contenant la plus rare des lettres de s sont parcourus.
+    """
+    if not s:
+        return set(mots)
+    if next(_recherches(mots)) < _RECHERCHES_AVANT_INDEX:
+        return {mot for mot in mots if s in mot}
+    groupes = _mots_par_lettre(mots)
+    if len(s) == 1:
+        return set(groupes.get(s, ()))
+    candidats = min((groupes.get(lettre, ()) for lettre in set(s)), key=len)
+    return {mot for mot in candidats if s in mot}
+
+
+def _bornes(mots_tries, start):
+    """retourne les bornes de la tranche des mots triés commençant par start,
+    par recherche dichotomique
+
+    La fin est cherchée sur les débuts de mots (tronqués à la longueur de start),
+    qui restent triés : aucune borne artificielle comme start + "\U0010ffff",
+    qui écarterait les mots où ce caractère suit start.
+    """
+    debut = bisect.bisect_left(mots_tries, start)
+    return debut, bisect.bisect_right(mots_tries, start, debut, key=lambda mot: mot[:len(start)])
+
+
+@functools.lru_cache(maxsize=128)
+def _chercheur(chaines):
+    """retourne la méthode search d'une expression régulière trouvant l'une des chaines du tuple chaines"""
+    return re.compile("|".join(map(re.escape, chaines))).search
+
+
+def _candidats(mots, starts, stops, nmin, nmax):
+    """retourne le plus petit groupe de candidats de l'ensemble figé (frozenset) mots
+
+    Les groupes comparés sont les mots de nmin à nmax lettres, les mots
+    commençant par une chaine de starts et les mots finissant par une chaine
+    de stops ; leurs tailles sont connues grâce aux index, sans les parcourir.
+    """
+    groupes = [groupe for longueur, groupe in _mots_par_longueur(mots).items() if nmin <= longueur <= nmax]
+    tries, inverses = _mots_tries(mots), _mots_inverses_tries(mots)
+    debuts = [_bornes(tries, start) for start in set(starts)]
+    fins = [_bornes(inverses, stop[::-1]) for stop in set(stops)]
+    taille_groupes = sum(map(len, groupes))
+    taille_debuts = sum(fin - debut for debut, fin in debuts)
+    taille_fins = sum(fin - debut for debut, fin in fins)
+    if taille_groupes <= min(taille_debuts, taille_fins):
+        return itertools.chain.from_iterable(groupes)
+    if taille_debuts <= taille_fins:
+        return itertools.chain.from_iterable(tries[debut:fin] for debut, fin in debuts)
+    return (inverse[::-1] for debut, fin in fins for inverse in inverses[debut:fin])
 
 
 def mots_de_n_lettres(mots, n):
@@ -100,14 +295,14 @@ def mots_de_n_lettres(mots, n):
     >>> sorted(list(mots_de_n_lettres(mots,25)))
     ['anticonstitutionnellement', 'oto-rhino-laryngologistes']
     """
-    f = set()
-    for i in mots:
-        if len(i) == n:
-            f.add("i")
-    return f
+    corpus = _corpus_fige(mots)
+    if corpus is not None:
+        return set(_mots_par_longueur(corpus).get(n, ()))
+    return {mot for mot in mots if len(mot) == n}
     
 
 
+@_memoise
 def mots_avec(mots, s):
     """retourne le sous ensemble des mots incluant la lettre l
 
@@ -131,10 +326,48 @@ def mots_avec(mots, s):
     >>> sorted(list(mk))[999::122]
     ['képi', 'nickela', 'parkérisiez', 'semi-coke', 'stockais', 'week-end']
     """
-    return mots & {mot for mot in mots if s in mot}
+    if not s:
+        # la chaine vide est incluse dans tous les mots : simple copie de l'ensemble
+        return set(mots)
+    return mots_avec_many(mots, [s])[s]
+
+
+def mots_avec_many(mots, chaines):
+    """retourne, pour chaque chaine de chaines, le sous ensemble des mots la contenant
+
+    Pour un corpus chargé, chaque chaine est cherchée dans les index ; sinon,
+    au delà de quatre chaines, l'ensemble des mots n'est parcouru qu'une
+    seule fois, quel que soit le nombre de chaines recherchées.
+
+    Args:
+        mots (set): ensemble de mots
+        chaines (list): liste des chaines de caractères à inclure
+
+    Returns:
+        dict: associe à chaque chaine le sous ensemble des mots la contenant
+
+    >>> mots = ensemble_mots(FILENAME)
+    >>> resultats = mots_avec_many(mots, ['k', 'w', 'oo'])
+    >>> [len(resultats[s]) for s in ['k', 'w', 'oo']]
+    [1621, 537, 486]
+    """
+    corpus = _corpus_fige(mots)
+    if corpus is not None:
+        return {s: _mots_contenant(corpus, s) for s in chaines}
+    resultats = {s: set() for s in chaines}
+    if len(resultats) <= 4:
+        # une compréhension par chaine reste plus rapide qu'un seul parcours
+        # qui teste toutes les chaines, tant qu'elles sont peu nombreuses
+        return {s: {mot for mot in mots if s in mot} for s in resultats}
+    for mot in mots:
+        for s, resultat in resultats.items():
+            if s in mot:
+                resultat.add(mot)
+    return resultats
     
 
 
+@_memoise
 def cherche1(mots, start, stop, n):
     """retourne le sous ensemble des mots de n lettres commençant par start et finissant par stop
 
@@ -156,18 +389,28 @@ def cherche1(mots, start, stop, n):
     >>> sorted(list(m_z))[4:7]
     ['zinguez', 'zippiez', 'zonerez']
     """
-    
+    corpus = _corpus_fige(mots)
+    if corpus is not None:
+        if len(start) <= 1 and len(stop) <= 1:
+            # au plus une lettre de chaque côté : le groupe est la réponse, sans parcours
+            if not start and not stop:
+                return set(_mots_par_longueur(corpus).get(n, ()))
+            return set(_mots_par_extremites(corpus, bool(start), bool(stop)).get((n, start, stop), ()))
+        # seul le plus petit groupe de candidats est parcouru : les mots de n
+        # lettres, les mots commençant par start ou les mots finissant par stop
+        mots = _candidats(corpus, (start,), (stop,), n, n)
     return {mot for mot in mots if len(mot) == n and mot.startswith(start) and mot.endswith(stop)}
 
 
+@_memoise
 def cherche2(mots, lstart, lmid, lstop, nmin, nmax):
     """effectue une recherche complexe dans un ensemble de mots
 
     Args:
         mots (set): ensemble de mots
-        lstart (list): liste des préfixes
-        lmid (list): liste des chaines de caractères intermédiaires
-        lstop (list): liste des suffixes
+        lstart (list): liste des préfixes (ou un seul préfixe)
+        lmid (list): liste des chaines de caractères intermédiaires (ou une seule chaine)
+        lstop (list): liste des suffixes (ou un seul suffixe)
         nmin (int): nombre de lettres minimum
         nmax (int): nombre de lettres maximum
 
@@ -182,16 +425,61 @@ def cherche2(mots, lstart, lmid, lstop, nmin, nmax):
     1
     >>> mab17ez
     {'alphabétisassiez'}
+    >>> cherche2(mots, 'auto', 'mat', 'ment', 12, 18)
+    {'automatiquement'}
     """
-    
-    resultat = set()
-    for mot in mots:
-        if nmin <= len(mot) <= nmax:
-            if any(mot.startswith(start) for start in lstart):
-                if any(mid in mot[1:-1] for mid in lmid):
-                    if any(mot.endswith(stop) for stop in lstop):
-                        resultat.add(mot)
-    return resultat
+    # une chaine seule vaut une liste d'une chaine, et non la liste de ses lettres
+    lstart, lmid, lstop = ([l] if isinstance(l, str) else l for l in (lstart, lmid, lstop))
+    if not lstart or not lmid or not lstop:
+        return set()
+    # str.startswith et str.endswith acceptent un tuple : un seul appel par mot
+    starts, mids, stops = tuple(lstart), tuple(dict.fromkeys(lmid)), tuple(lstop)
+    corpus = _corpus_fige(mots)
+    if corpus is not None:
+        # seul le plus petit groupe de candidats est parcouru : les mots de
+        # nmin à nmax lettres, ceux commençant par lstart ou ceux finissant par lstop
+        mots = _candidats(corpus, starts, stops, nmin, nmax)
+    candidats = {
+        mot for mot in mots
+        if nmin <= len(mot) <= nmax and mot.startswith(starts) and mot.endswith(stops)
+    }
+    if len(mids) <= 2:
+        # le test « in » d'une chaine littérale est le plus rapide : une passe par chaine
+        # reste moins coûteuse que l'expression régulière jusqu'à deux chaines
+        return {mot for mid in mids for mot in candidats if mid in mot[1:-1]}
+    # au delà, une seule expression régulière cherche toutes les chaines de lmid, sans
+    # découper le mot : la recherche est bornée entre la 2e et l'avant-dernière lettre
+    chercher = _chercheur(mids)
+    return {mot for mot in candidats if chercher(mot, 1, max(len(mot) - 1, 1))}
+
+
+def premiers_mots(mots, k):
+    """retourne les k premiers mots de mots dans l'ordre alphabétique
+
+    Pour un ensemble modifiable (set), seuls les k plus petits mots sont triés,
+    sans trier tout l'ensemble. Pour un ensemble figé (frozenset), le premier appel
+    trie une fois tout l'ensemble (index partagé avec les recherches par préfixe) ;
+    les appels suivants ne font que découper la liste triée.
+
+    Args:
+        mots (set): ensemble de mots
+        k (int): nombre de mots
+
+    Returns:
+        list: liste triée des k premiers mots (ou de tous s'il y en a moins)
+
+    >>> premiers_mots({'tu', 'il', 'je', 'elle'}, 2)
+    ['elle', 'il']
+    >>> premiers_mots({'tu', 'il', 'je', 'elle'}, -1)
+    []
+    >>> premiers_mots(frozenset(ensemble_mots(FILENAME)), 3)
+    ['Antéchrist', 'Antéchrists', 'Avé']
+    """
+    corpus = _corpus_fige(mots)
+    if corpus is not None:
+        # le corpus est trié une fois pour toutes ; un k négatif ne rend aucun mot
+        return list(_mots_tries(corpus)[:max(k, 0)])
+    return heapq.nsmallest(k, mots)
 
 
 def main():
@@ -202,10 +490,10 @@ def main():
     # m17 = mots_de_n_lettres(ens, 17)
     # print(len(m17))
     # print( random.sample(list(m17), 10) )
-    # mk = mots_avec(ens, 'k')
+    # avec = mots_avec_many(ens, ['k', 'oo'])
+    # mk, moo = avec['k'], avec['oo']
     # print(len(mk))
     # print( random.sample(list(mk), 5) )
-    # moo = mots_avec(ens, 'oo')
     # print(len(moo))
     # print( random.sample(list(moo), 5) )
     # mz14 = cherche1(ens, 'z', '', 14)